@@ -0,0 +1,859 @@
+"""
+Kilter Board Route Generator - GUI
+
+Tkinter front end for the route generator in project.py: the board canvas, the
+parameter sliders, route drawing and route saving.
+
+Kept in its own module so that importing project (or failing one of its startup
+checks) doesn't pay for loading Tk; project.main() imports this module only once the
+board layout has been loaded. The dependency only goes one way: start_gui() is handed
+the route generator, scoring and resource lookup functions, and this module never
+imports project.
+"""
+
+import tkinter as tk
+from tkinter import Canvas, Button, messagebox, filedialog
+import json
+import os
+import random
+import re
+
+# Optional: orjson serializes saved routes several times faster than the stdlib json
+# module. The app works without it and falls back to json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Color mapping for visual representation of different hold types in the GUI
+# These colors help climbers quickly identify start, hand, foot, and finish holds on the board
+HOLD_COLORS = {
+    "start": "#00dd02",   # bright green - clearly visible start holds
+    "hand":  "#03ffff",   # bright blue - intermediate hand holds
+    "foot":  "#ffa500",   # orange - foot placement holds
+    "finish": "#ff00ff"   # bright pink - clearly visible finish holds
+}
+
+# Board grid drawn on the canvas: the photo shows the same 35×35 positions as the
+# layout file (project.BOARD_ROWS/BOARD_COLS)
+BOARD_ROWS = 35
+BOARD_COLS = 35
+
+# Board canvas scaling
+CELL_SIZE = 20   # pixels per square - determines visual scaling of the board in the GUI
+PADDING = 20     # padding around the board canvas for visual spacing
+
+# --- MODERN GUI STYLES ---
+# Color scheme for a modern, dark-themed interface that's easy on the eyes
+# and provides good contrast for route visualization
+BG_COLOR = "#1e1e1e"            # dark gray - main background for professional appearance
+FG_TEXT_COLOR_BLACK = "#000000" # black - for text on light backgrounds (tooltips, buttons)
+FG_TEXT_COLOR_WHITE = "#FFFFFF" # white - for text on dark backgrounds (main UI)
+ACCENT_COLOR = "#007acc"        # blue accent - primary action button color
+ERROR_COLOR = "#ff4d4d"         # red for errors - draws attention to validation issues
+BUTTON_COLOR = "#2a2a2a"        # secondary button background
+BUTTON_HOVER = "#3a3a3a"        # button hover state - provides visual feedback
+
+# Color coding for the difficulty label so users can identify route difficulty at a glance
+DIFFICULTY_COLORS = {
+    "Easy":         "#00dd02",      # green - easy routes
+    "Intermediate": ACCENT_COLOR,   # blue - intermediate routes
+    "Hard":         "#ffa500",      # orange - hard routes
+    "Very Hard":    "#ff4d4d"       # red - very hard routes
+}
+
+# Route parameter sliders shown in the control panel, top to bottom:
+# (name, label, minimum, maximum, default, tooltip). KilterBoardGUI creates one row per entry
+# and stores its widgets as self.<name>_slider / self.<name>_value. The sliders only shape
+# route generation - difficulty is calculated from the actual generated route.
+SLIDER_SPECS = (
+    # Maximum Euclidean distance between consecutive hand holds: higher values allow longer
+    # moves; 2-20 covers everything from technical slab routes to dynamic overhang routes
+    ("max_reach", "Max Reach:", 2, 20, 12, "Maximum Euclidean distance between consecutive holds."),
+    # Minimum distance between consecutive hand holds, so holds aren't unrealistically close;
+    # works with Max Reach to define the range of acceptable move distances
+    ("min_reach", "Min Reach:", 2, 18, 2, "Minimum Euclidean distance between consecutive holds."),
+    # Maximum number of hand moves (excluding start and finish holds): 2-20 covers short
+    # boulder problems to full-length routes
+    ("max_moves", "Max Moves:", 2, 20, 12, "Maximum number of hand moves in the route."),
+    # Minimum number of hand moves, so routes have a minimum length
+    ("min_moves", "Min Moves:", 2, 20, 2, "Minimum number of hand moves in the route."),
+)
+
+# --- TOOLTIP CLASS ---
+class ToolTip:
+    """
+    Create a tooltip for a given widget.
+    
+    Displays helpful information when the user hovers over a widget.
+    The tooltip appears after a 500ms delay and disappears when the mouse leaves.
+    
+    Attributes:
+        widget: The Tkinter widget to attach the tooltip to
+        text: The tooltip text to display
+        tipwindow: The Toplevel window containing the tooltip
+        id: Scheduled event ID for showing the tooltip
+    """
+    def __init__(self, widget, text='widget info'):
+        self.widget = widget
+        self.text = text
+        self.tipwindow = None
+        self.id = None
+        self.x = self.y = 0
+        self.widget.bind('<Enter>', self.enter)
+        self.widget.bind('<Leave>', self.leave)
+        self.widget.bind('<ButtonPress>', self.leave)
+
+    def enter(self, event=None):
+        """Called when mouse enters the widget - schedules tooltip to appear after delay."""
+        self.schedule()
+
+    def leave(self, event=None):
+        """Called when mouse leaves the widget - cancels tooltip and hides it immediately."""
+        self.unschedule()
+        self.hidetip()
+
+    def schedule(self):
+        """
+        Schedule the tooltip to appear after 500ms delay.
+        
+        This delay prevents tooltips from appearing instantly on every mouse movement,
+        improving user experience by only showing tooltips when the user hovers intentionally.
+        """
+        self.unschedule()  # Cancel any existing scheduled tooltip
+        self.id = self.widget.after(500, self.showtip)  # Schedule after 500ms
+
+    def unschedule(self):
+        """
+        Cancel any scheduled tooltip display.
+        
+        This prevents multiple tooltips from queuing up if the user moves the mouse
+        quickly across multiple widgets.
+        """
+        id = self.id
+        self.id = None
+        if id:
+            self.widget.after_cancel(id)  # Cancel the scheduled event
+
+    def showtip(self, event=None):
+        """
+        Display the tooltip window at the mouse cursor position.
+        
+        Calculates position relative to the widget and creates a borderless Toplevel
+        window with the tooltip text. The tooltip appears slightly offset from the
+        cursor (25px right, 20px down) to avoid covering the widget.
+        """
+        # Get widget's bounding box if available (for text widgets), otherwise use (0,0)
+        x, y, cx, cy = self.widget.bbox("insert") if hasattr(self.widget, 'bbox') else (0, 0, 0, 0)
+        # Convert widget-relative coordinates to screen coordinates
+        x += self.widget.winfo_rootx() + 25  # Offset right to avoid covering widget
+        y += self.widget.winfo_rooty() + 20  # Offset down for better visibility
+        # Create borderless tooltip window
+        self.tipwindow = tw = tk.Toplevel(self.widget)
+        tw.wm_overrideredirect(True)  # Remove window decorations (title bar, borders)
+        tw.wm_geometry("+%d+%d" % (x, y))  # Position at calculated coordinates
+        # Create label with tooltip text - light yellow background for visibility
+        label = tk.Label(tw, text=self.text, justify='left',
+                         background="#ffffe0", relief='solid', borderwidth=1,
+                         font=("tahoma", "8", "normal"), wraplength=200, fg=FG_TEXT_COLOR_BLACK)
+        label.pack(ipadx=1)
+
+    def hidetip(self):
+        """
+        Hide and destroy the tooltip window.
+        
+        Called when mouse leaves the widget or when widget is clicked.
+        Ensures tooltips don't linger on screen after user interaction.
+        """
+        tw = self.tipwindow
+        self.tipwindow = None
+        if tw:
+            tw.destroy()  # Clean up the tooltip window
+
+def row_to_y(row: int) -> float:
+    """
+    Compute the canvas y coordinate of the center of a board row.
+    
+    The board has non-uniform row spacing due to the physical layout:
+    - Rows 1-2: Top section with 19.5px spacing
+    - Rows 3-31: Middle section with 18px spacing
+    - Rows 32-35: Bottom section with 39px spacing
+    
+    Args:
+        row: Row position (1-35)
+    
+    Returns:
+        Canvas y coordinate in pixels
+    """
+    # Convert from 1-indexed board coordinates to 0-indexed pixel coordinates
+    row -= 1
+    
+    # Calculate y position based on row (non-uniform spacing due to board geometry)
+    # The physical Kilter Board has different row spacing in different sections,
+    # so we must account for this to accurately position holds on the image
+    if row <= 1:
+        # Top section: rows 1-2 have 19.5px spacing, starting at y=710
+        # These are the highest holds on the board (overhang section)
+        return 710 - (19.5 * row)
+    elif row <= 31:
+        # Middle section: rows 3-31 have 18px spacing, starting at y=650
+        # This is the main climbing area with consistent spacing
+        return 650 - (18 * (row - 2))
+    else:
+        # Bottom section: rows 32-35 have 39px spacing, starting at y=32
+        # These are the lowest holds (slab section) with wider spacing
+        return 32 + (39 * (34 - row))
+
+# Row -> canvas y lookup table (1-indexed like the board, index 0 unused), so the
+# piecewise row spacing is evaluated once per row instead of once per drawn hold
+ROW_Y = tuple(row_to_y(row) for row in range(BOARD_ROWS + 1))
+
+# Column -> canvas x lookup table (1-indexed; columns are evenly spaced across the board)
+COL_X = tuple(PADDING + (col - 1) * CELL_SIZE + CELL_SIZE / 2 for col in range(BOARD_COLS + 1))
+
+def hold_oval_bbox(col: int, row: int) -> tuple:
+    """
+    Compute the canvas bounding box of the marker drawn for a hold.
+    
+    The hold center comes from the COL_X/ROW_Y lookup tables (see row_to_y() for
+    the board's non-uniform row spacing), so no per-row branching happens here.
+    
+    Args:
+        col: Column position (1-35)
+        row: Row position (1-35)
+    
+    Returns:
+        Tuple of (x0, y0, x1, y1) canvas coordinates for create_oval
+    """
+    x = COL_X[col]
+    y = ROW_Y[row]
+
+    # Base radius for hold circles - determines visual size of hold markers
+    radius = CELL_SIZE
+
+    # Smaller holds in the top two rows or odd columns (even 0-indexed columns),
+    # matching the physical board layout which has smaller holds in these positions
+    if row <= 2 or col % 2 == 1:
+        radius *= .7  # Reduce size by 30% for smaller holds
+    
+    return (x - radius, y - radius, x + radius, y + radius)
+
+# Oval geometry of every board position, precomputed once as HOLD_BBOXES[col][row]
+# (1-indexed, index 0 unused) so drawing a route is a table lookup per hold
+HOLD_BBOXES = [
+    [hold_oval_bbox(col, row) for row in range(BOARD_ROWS + 1)]
+    for col in range(BOARD_COLS + 1)
+]
+
+# Characters that can appear unescaped in a Tcl word; everything else is backslash-escaped
+_TCL_UNSAFE = re.compile(r"[^\w.#+-]")
+
+def _tcl_quote(value) -> str:
+    """
+    Quote a value as a single word of a Tcl script.
+    
+    draw_climb() builds one Tcl script per redraw, so each value it interpolates must
+    stay one word no matter what it contains (a color with a space, brackets or a $
+    would otherwise split the command or be substituted by Tcl).
+    
+    Args:
+        value: Number or string to quote
+    
+    Returns:
+        str: The value as a Tcl word with every special character backslash-escaped
+    """
+    text = str(value)
+    if not text:
+        return "{}"
+    # A backslash before a newline would join lines, so newlines are written as \n
+    return _TCL_UNSAFE.sub(lambda m: "\\n" if m.group() == "\n" else "\\" + m.group(), text)
+
+class KilterBoardGUI:
+    """
+    Main GUI class for the Kilter Board Route Generator.
+    
+    Handles all user interface components including sliders, buttons, canvas,
+    and route display. Manages route generation, difficulty calculation,
+    and route saving functionality.
+    
+    Attributes:
+        root: The main Tkinter root window
+        current_climb: List of Hold objects representing the current route
+        canvas: Canvas widget for displaying the board and route
+        scaled_img: Scaled background image of the Kilter Board
+    """
+    def __init__(self, root, generate_climb, analyze_climb, resource_path):
+        """
+        Initialize the main GUI window and all UI components.
+        
+        Sets up a fullscreen window with two main sections:
+        - Left: Canvas displaying the Kilter Board with generated routes
+        - Right: Control panel with sliders, buttons, and route information
+        
+        The layout is designed for optimal route visualization and easy parameter adjustment.
+        
+        Args:
+            root: The main Tkinter root window
+            generate_climb: Route generator, called like project.generate_kilterclimb()
+            analyze_climb: Route scoring, called like project.analyze_route()
+            resource_path: Resolves a bundled file name to its path, like project.resource_path()
+        """
+        self.root = root
+        self._generate_climb = generate_climb
+        self._analyze_climb = analyze_climb
+        self._resource_path = resource_path
+        self.root.title("Kilter Board – Climb Generator")
+        # Start in fullscreen mode for maximum board visibility (press Escape to exit)
+        self.root.attributes('-fullscreen', True)
+        self.root.bind('<Escape>', lambda event: root.attributes('-fullscreen', False))
+        self.root.configure(bg=BG_COLOR)
+
+        # Shared control panel styling, registered once in the Tk option database instead of
+        # passing the same colors to every widget. The patterns are scoped to the control
+        # panel frame (named "controls") so message boxes and file dialogs keep their look.
+        # Widgets that need different colors (buttons, sliders, error text) still override them.
+        self.root.option_add("*controls*background", BG_COLOR)
+        self.root.option_add("*controls*Label.foreground", FG_TEXT_COLOR_WHITE)
+        self.root.option_add("*controls*Checkbutton.foreground", FG_TEXT_COLOR_WHITE)
+        # Parameter sliders: light text on a dark slider with the blue accent as the track
+        self.root.option_add("*controls*Scale.background", BUTTON_COLOR)
+        self.root.option_add("*controls*Scale.foreground", FG_TEXT_COLOR_WHITE)
+        self.root.option_add("*controls*Scale.highlightBackground", BG_COLOR)
+        self.root.option_add("*controls*Scale.troughColor", ACCENT_COLOR)
+        
+        # Store current climb for saving functionality
+        # This allows users to save routes they like to JSON files
+        self.current_climb = None
+
+        # Pool of canvas oval item IDs reused by draw_climb() across regenerations
+        self._hold_items = []
+        # (bbox, color) currently shown by each pooled item, in pool order; items past the
+        # end of this list are hidden
+        self._drawn_ovals = []
+
+        # Per-instance random generator for parameter randomization
+        self._rng = random.Random()
+
+        # Calculate canvas dimensions based on board size and padding
+        # This ensures the board is displayed at the correct scale
+        width = BOARD_COLS * CELL_SIZE + PADDING * 2
+        height = BOARD_ROWS * CELL_SIZE + PADDING * 2
+
+        # The background image is decoded lazily by _load_board_image() once the window is up
+        self.scaled_img = None
+
+        # Left Frame: Board Canvas
+        # This frame takes up the left side of the window and expands to fill available space
+        # The canvas displays the board image and overlays the generated route holds
+        left_frame = tk.Frame(root, bg=BG_COLOR)
+        left_frame.pack(side="left", fill="both", expand=True)
+
+        # Create canvas for drawing the board and route holds
+        # highlightthickness=0 removes the border for a cleaner look
+        self.canvas = Canvas(left_frame, width=width, height=height, bg=BG_COLOR, highlightthickness=0)
+        self.canvas.pack(padx=PADDING, pady=PADDING)
+
+        # Reserve the background image item at the top-left of the canvas (below all holds)
+        # and show a placeholder until the image has been decoded
+        # Decoding the large PNG blocks the main thread, so it is deferred until the window
+        # has been mapped (start_gui() keeps it withdrawn while it is built) and the event
+        # loop is idle - the window appears immediately and the image streams in
+        self._img_item = self.canvas.create_image(PADDING, PADDING, anchor="nw")
+        self._placeholder_item = self.canvas.create_rectangle(
+            PADDING, PADDING, width - PADDING, height - PADDING,
+            fill=BUTTON_COLOR, outline=""
+        )
+        self._map_binding = self.root.bind("<Map>", self._on_root_map, add="+")
+
+        # Right Frame: Controls
+        # This frame contains all user controls and route information
+        # It's fixed-width on the right side, allowing the board canvas to use remaining space
+        right_frame = tk.Frame(root, name="controls", bg=BG_COLOR, padx=20, pady=20)
+        right_frame.pack(side="right", fill="y")
+
+        # Title Label
+        # Provides clear application identification at the top of the control panel
+        title_label = tk.Label(right_frame, text="Kilter Board Route Generator", font=("Segoe UI", 14, "bold"))
+        title_label.pack(pady=(0, 15))
+
+        # Slider Section
+        # Contains all parameter sliders for route generation
+        # These sliders control route characteristics but don't directly set difficulty
+        # (difficulty is calculated from the actual generated route)
+        slider_frame = tk.Frame(right_frame)
+        slider_frame.pack(fill="x", pady=10)
+
+        # One row per SLIDER_SPECS entry: name label, slider, and live value label
+        # Each slider is stored as self.<name>_slider, its value label as self.<name>_value
+        # and the IntVar they share as self.<name>_var
+        for grid_row, (name, text, from_, to, default, tip) in enumerate(SLIDER_SPECS):
+            tk.Label(slider_frame, text=text).grid(row=grid_row, column=0, sticky="w", padx=5)
+
+            # The slider and its value label are bound to the same Tk variable, so Tk keeps the
+            # label in sync while dragging without a Python callback per slider movement
+            var = tk.IntVar(value=default)
+            slider = tk.Scale(
+                slider_frame,
+                from_=from_,
+                to=to,
+                orient="horizontal",
+                length=200,   # Slider width in pixels
+                variable=var
+            )
+            slider.grid(row=grid_row, column=1, padx=5)
+            ToolTip(slider, f"{tip} Note: Final difficulty is computed from the actual route, not these sliders.")
+
+            # Display current slider value for immediate feedback
+            value_label = tk.Label(slider_frame, textvariable=var)
+            value_label.grid(row=grid_row, column=2, padx=5)
+
+            setattr(self, f"{name}_var", var)
+            setattr(self, f"{name}_slider", slider)
+            setattr(self, f"{name}_value", value_label)
+
+        # Checkboxes
+        # These options modify route generation behavior for different route styles
+        checkbox_frame = tk.Frame(right_frame)
+        checkbox_frame.pack(fill="x", pady=15)
+
+        # Crazy Mode Checkbox
+        # When enabled, removes the upward progression requirement, allowing:
+        # - Downward moves (traverse-style routes)
+        # - Sideways moves (more lateral movement)
+        # - Same-level moves (technical sequences)
+        # This creates more varied, less traditional routes
+        self.crazy_checkbox_var = tk.BooleanVar()
+        crazy_check = tk.Checkbutton(
+            checkbox_frame,
+            text="Remove Upward Restriction",
+            variable=self.crazy_checkbox_var,
+            selectcolor=BUTTON_COLOR,
+            activebackground=BG_COLOR,
+            activeforeground=FG_TEXT_COLOR_BLACK
+        )
+        crazy_check.pack(anchor="w", padx=5)
+        ToolTip(crazy_check, "Allow downward or sideways moves (disable strict upward progression)")
+
+        # Two Finishes Checkbox
+        # When enabled, routes may have 1 or 2 finish holds (randomly chosen)
+        # Two finish holds are common in real climbing and provide more finish options
+        # When disabled, routes always have exactly 1 finish hold
+        self.two_finishes_checkbox_var = tk.BooleanVar()
+        two_fishes_check = tk.Checkbutton(
+            checkbox_frame,
+            text="Allow Two Finishes",
+            variable=self.two_finishes_checkbox_var,
+            selectcolor=BUTTON_COLOR,
+            activebackground=BG_COLOR,
+            activeforeground=FG_TEXT_COLOR_BLACK
+        )
+        two_fishes_check.select()  # Default: enabled (more realistic)
+        two_fishes_check.pack(anchor="w", padx=5)
+        ToolTip(two_fishes_check, "Generate routes with one or two finish holds")
+        
+        # Difficulty Label (updated after route generation)
+        self.difficulty_label = tk.Label(
+            right_frame,
+            text="Difficulty: Generate a route to see difficulty",
+            font=("Segoe UI", 11, "bold")
+        )
+        self.difficulty_label.pack(pady=10)
+        ToolTip(self.difficulty_label, "Final difficulty is calculated from the actual route after generation, based on hold types, wall angle, move distances, and sequence flow.")
+        
+        # Flow Score Label
+        self.flow_label = tk.Label(
+            right_frame,
+            text="",
+            font=("Segoe UI", 10),
+            fg=FG_TEXT_COLOR_BLACK
+        )
+        self.flow_label.pack(pady=5)
+
+        # Generate Button
+        # This is the primary action button - generates a new route based on current settings
+        button_frame = tk.Frame(right_frame)
+        button_frame.pack(fill="x", pady=20)
+
+        self.button = Button(
+            button_frame,
+            text="Generate New Climb",
+            command=self.generate_and_draw,  # Calls route generation and display
+            bg=ACCENT_COLOR,  # Blue accent color to indicate primary action
+            fg=FG_TEXT_COLOR_BLACK,
+            font=("Segoe UI", 10, "bold"),
+            relief="flat",  # Modern flat button style
+            padx=20,
+            pady=10
+        )
+        self.button.pack(pady=5)
+
+        # Hover Effect (optional)
+        # Provides visual feedback when user hovers over the button
+        # Darker blue on hover indicates interactivity
+        self.button.bind("<Enter>", lambda e: self.button.config(bg="#0066cc"))
+        self.button.bind("<Leave>", lambda e: self.button.config(bg=ACCENT_COLOR))
+
+        # Save Route Button
+        self.save_button = Button(
+            button_frame,
+            text="Save Route",
+            command=self.save_route,
+            bg=BUTTON_COLOR,
+            fg=FG_TEXT_COLOR_BLACK,
+            font=("Segoe UI", 10),
+            relief="flat",
+            padx=20,
+            pady=10,
+            state="disabled"
+        )
+        self.save_button.pack(pady=5)
+        self.save_button.bind("<Enter>", lambda e: self.save_button.config(bg=BUTTON_HOVER) if self.save_button['state'] == 'normal' else None)
+        self.save_button.bind("<Leave>", lambda e: self.save_button.config(bg=BUTTON_COLOR) if self.save_button['state'] == 'normal' else None)
+
+        # Reset Button
+        self.reset_button = Button(
+            button_frame,
+            text="Reset to Defaults",
+            command=self.reset_to_defaults,
+            bg=BUTTON_COLOR,
+            fg=FG_TEXT_COLOR_BLACK,
+            font=("Segoe UI", 10),
+            relief="flat",
+            padx=20,
+            pady=10
+        )
+        self.reset_button.pack(pady=5)
+        self.reset_button.bind("<Enter>", lambda e: self.reset_button.config(bg=BUTTON_HOVER))
+        self.reset_button.bind("<Leave>", lambda e: self.reset_button.config(bg=BUTTON_COLOR))
+
+        # Randomize Button
+        self.randomize_button = Button(
+            button_frame,
+            text="Randomize Parameters",
+            command=self.randomize_parameters,
+            bg=BUTTON_COLOR,
+            fg=FG_TEXT_COLOR_BLACK,
+            font=("Segoe UI", 10),
+            relief="flat",
+            padx=20,
+            pady=10
+        )
+        self.randomize_button.pack(pady=5)
+        self.randomize_button.bind("<Enter>", lambda e: self.randomize_button.config(bg=BUTTON_HOVER))
+        self.randomize_button.bind("<Leave>", lambda e: self.randomize_button.config(bg=BUTTON_COLOR))
+
+        # Error Labels
+        self.error_label_reach = tk.Label(right_frame, text="", fg=ERROR_COLOR, wraplength=300, justify="center")
+        self.error_label_reach.pack(pady=5)
+
+        self.error_label_moves = tk.Label(right_frame, text="", fg=ERROR_COLOR, wraplength=300, justify="center")
+        self.error_label_moves.pack(pady=5)
+
+        # Draw empty grid once
+        # self.draw_grid()
+
+    def _on_root_map(self, event):
+        """
+        Queue the background image load the first time the main window is shown.
+        
+        Bound to the root window's <Map> event in __init__ and removed again once the
+        root itself is mapped, so the image is decoded after the window appears rather
+        than while it is still withdrawn. Child widgets carry the root in their
+        bindtags, so their own <Map> events also arrive here and are ignored.
+        
+        Args:
+            event: The Tk <Map> event
+        """
+        if event.widget is not self.root:
+            return
+        self.root.unbind("<Map>", self._map_binding)
+        self.root.after_idle(self._load_board_image)
+
+    def _load_board_image(self):
+        """
+        Decode the background image of the physical Kilter Board.
+        
+        Scheduled from the first <Map> of the main window (see _on_root_map()) so the
+        window is shown before the PNG is decoded. The image provides visual context showing the actual board
+        layout. IMG_4033_half.png is the full-size IMG_4033.png pre-scaled by 2x2,
+        so no subsample pass over the pixels is needed at runtime. If it is missing,
+        it is regenerated once from IMG_4033.png and written back for later launches.
+        """
+        half_path = self._resource_path("IMG_4033_half.png")
+        if os.path.exists(half_path):
+            self.scaled_img = tk.PhotoImage(file=half_path)
+        else:
+            # Scale the full-size photo down by 2x2 (the slow path) and save the result so
+            # the next launch can load it directly; a read-only install just skips the save
+            self.scaled_img = tk.PhotoImage(file=self._resource_path("IMG_4033.png")).subsample(2, 2)
+            try:
+                self.scaled_img.write(half_path, format="png")
+            except tk.TclError:
+                pass
+        # Swap the image into the reserved canvas item and drop the placeholder
+        self.canvas.itemconfig(self._img_item, image=self.scaled_img)
+        self.canvas.delete(self._placeholder_item)
+
+    def update_difficulty(self, climb=None):
+        """
+        Update the difficulty label based on the actual generated route.
+        
+        Calculates route difficulty and flow score in one pass with the analyze_climb
+        function given to __init__ (project.analyze_route()).
+        Only displays difficulty after a route is generated.
+        If no route is provided, shows a message prompting the user to generate one.
+        
+        Args:
+            climb: List of Hold objects representing the route, or None to reset display
+        """
+        if climb is None:
+            self.difficulty_label.config(
+                text="Difficulty: Generate a route to see difficulty",
+                fg=FG_TEXT_COLOR_BLACK
+            )
+            self.flow_label.config(text="")
+            return
+        
+        # Calculate route difficulty and flow in one shared analysis pass
+        # This analyzes the actual generated route (not the sliders) to determine difficulty
+        # based on hold types, move distances, wall angle, and sequence flow, and whether the
+        # sequence has smooth left/right alternation and upward consistency
+        difficulty_label, difficulty_score, flow_label = self._analyze_climb(climb)
+        
+        # Set color based on difficulty level for visual feedback (table lookup, no branching)
+        color = DIFFICULTY_COLORS.get(difficulty_label, ACCENT_COLOR)
+        
+        self.difficulty_label.config(
+            text=f"Difficulty: {difficulty_label} (Score: {difficulty_score:.2f})",
+            fg=color
+        )
+        # Only show flow label if it's not empty (i.e., score ≥ 70%)
+        if flow_label:
+            self.flow_label.config(text=flow_label, fg=FG_TEXT_COLOR_WHITE)
+        else:
+            self.flow_label.config(text="")
+
+    def reset_to_defaults(self):
+        """
+        Reset all sliders and checkboxes to default values.
+        
+        Slider defaults come from SLIDER_SPECS, so they always match the values the sliders
+        were created with. Checkbox defaults:
+        - Remove Upward Restriction = Off
+        - Allow Two Finishes = On
+        """
+        # Set each slider's shared IntVar back to its SLIDER_SPECS default
+        for name, _text, _from, _to, default, _tip in SLIDER_SPECS:
+            getattr(self, f"{name}_var").set(default)
+        self.crazy_checkbox_var.set(False)
+        self.two_finishes_checkbox_var.set(True)
+        self.update_difficulty()  # Reset to default message
+
+    def randomize_parameters(self):
+        """
+        Set sliders to random valid values within their ranges.
+        
+        Uses wider ranges than defaults to allow generation of Hard/Very Hard routes:
+        - Min Reach: 2-15, Max Reach: 8-20 (ensures max > min)
+        - Min Moves: 2-15, Max Moves: 10-20 (ensures max > min)
+        - Two Finishes: 50% chance
+        - Crazy Mode: 20% chance
+        
+        This function enables quick exploration of different route types.
+        """
+        min_reach = self._rng.randint(2, 15)  # Wider range → harder routes possible
+        max_reach = self._rng.randint(max(min_reach + 1, 8), 20)  # Ensure max > min, and can be high
+        min_moves = self._rng.randint(2, 15)
+        max_moves = self._rng.randint(max(min_moves + 1, 10), 20)
+        
+        self.min_reach_slider.set(min_reach)
+        self.max_reach_slider.set(max_reach)
+        self.min_moves_slider.set(min_moves)
+        self.max_moves_slider.set(max_moves)
+        
+        # Two Finishes: 50% chance on
+        self.two_finishes_checkbox_var.set(self._rng.random() < 0.5)
+        
+        # Crazy Mode: 20% chance on
+        self.crazy_checkbox_var.set(self._rng.random() < 0.2)
+        
+        self.update_difficulty()  # Reset to default message (since no route generated yet)
+
+
+    def save_route(self):
+        """
+        Save the current route to a JSON file.
+        
+        Opens a file dialog for the user to choose save location and filename.
+        Saves route data in JSON format with all hold positions and types.
+        Shows success/error messages via popup dialogs.
+        
+        Raises:
+            Shows error dialog if save fails (file permissions, disk full, etc.)
+        """
+        if self.current_climb is None:
+            messagebox.showwarning("No Route", "Please generate a route first before saving.")
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            title="Save Route"
+        )
+        
+        if filename:
+            try:
+                # Build JSON structure with route data
+                # Format: {"holds": [{"col": int, "row": int, "type": str}, ...]}
+                # This format allows routes to be loaded and shared between sessions
+                route_data = {
+                    "holds": [
+                        {
+                            "col": hold.col,      # Column position (1-35)
+                            "row": hold.row,      # Row position (1-35)
+                            "type": hold.type     # Hold type: "start", "hand", "foot", "finish"
+                        }
+                        for hold in self.current_climb
+                    ]
+                }
+                # Write JSON to file with indentation for readability
+                # orjson encodes straight to bytes when available; the output format is the same
+                if orjson is not None:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(route_data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(filename, 'w') as f:
+                        json.dump(route_data, f, indent=2)
+                messagebox.showinfo("Success", f"Route saved to {filename}")
+            except Exception as e:
+                # Handle errors gracefully (file permissions, disk full, etc.)
+                messagebox.showerror("Error", f"Failed to save route: {str(e)}")
+
+    def draw_climb(self, climb):
+        """
+        Draws a given climb on the Kilter Board canvas.
+        
+        Hold positions are converted to canvas geometry through the precomputed
+        HOLD_BBOXES table (see hold_oval_bbox()), which accounts for the board's
+        non-uniform row spacing.
+        
+        Args:
+            climb: List of Hold objects representing the route to draw
+        """
+        # Look up every oval's geometry and color up front
+        bboxes = HOLD_BBOXES
+        colors = HOLD_COLORS
+        ovals = [(bboxes[hold.col][hold.row], colors.get(hold.type, "white")) for hold in climb]
+
+        # Reuse the pooled oval items instead of deleting and recreating them on every route
+        # The pool only grows when a route has more holds than any route drawn before
+        canvas = self.canvas
+        items = self._hold_items
+        while len(items) < len(ovals):
+            items.append(canvas.create_oval(0, 0, 0, 0, fill="", width=3, state="hidden", tags="hold"))
+
+        # Move and recolor the pooled items with one Tcl script, so the whole redraw is a
+        # single round-trip into the Tcl interpreter instead of two calls per hold
+        # Every interpolated value goes through _tcl_quote() so it stays a single Tcl word
+        # Items already showing the same oval as in the previous route are left untouched
+        path = _tcl_quote(canvas)
+        quote = _tcl_quote
+        drawn = self._drawn_ovals
+        shown = len(drawn)
+        script = []
+        for k, (item, oval) in enumerate(zip(items, ovals)):
+            if k < shown and drawn[k] == oval:
+                continue
+            (x1, y1, x2, y2), color = oval
+            item = quote(item)
+            script.append(f"{path} coords {item} {quote(x1)} {quote(y1)} {quote(x2)} {quote(y2)}")
+            script.append(f"{path} itemconfigure {item} -outline {quote(color)} -state normal")
+
+        # Hide pooled items left over from longer previous routes
+        # Items past the previous route's length are already hidden, so they are skipped
+        for item in items[len(ovals):shown]:
+            script.append(f"{path} itemconfigure {quote(item)} -state hidden")
+        if script:
+            canvas.tk.eval("\n".join(script))
+        self._drawn_ovals = ovals
+
+    def generate_and_draw(self):
+        """
+        Generates a new route based on current slider settings and displays it.
+        
+        Validates input parameters, generates the route using generate_kilterclimb(),
+        draws it on the canvas, calculates and displays difficulty, and enables
+        the save button if generation is successful.
+        
+        Shows error messages (both popup and red text) if min >= max for reach or moves.
+        """
+        # Get current parameter values from UI controls
+        max_reach = self.max_reach_slider.get()
+        min_reach = self.min_reach_slider.get()
+        # Subtract 1 from moves because generate_kilterclimb counts moves differently
+        # (it counts hand moves excluding start/finish, while sliders include them)
+        max_moves = self.max_moves_slider.get()-1 
+        min_moves = self.min_moves_slider.get()-1
+        crazy_mode = self.crazy_checkbox_var.get()
+        allow_two_finishes = self.two_finishes_checkbox_var.get()
+
+        # Clear previous error messages to avoid confusion
+        self.error_label_reach.config(text="")
+        self.error_label_moves.config(text="")
+
+        # Validate inputs strictly (min must be strictly less than max)
+        # This ensures there's a valid range for route generation
+        if min_reach >= max_reach:
+            error_msg = "Min reach must be less than Max reach"
+            self.error_label_reach.config(text=f"Invalid Input: {error_msg}")
+            messagebox.showerror("Invalid Input", error_msg)
+            return
+
+        if min_moves >= max_moves:
+            error_msg = "Min moves must be less than Max moves"
+            self.error_label_moves.config(text=f"Invalid Input: {error_msg}")
+            messagebox.showerror("Invalid Input", error_msg)
+            return
+
+        # Generate the route using the rule-based algorithm
+        # This function creates a complete route following real route-setting principles
+        climb = self._generate_climb(min_moves=min_moves, 
+            max_moves=max_moves,
+            min_reach=min_reach,
+            allow_two_finishes=allow_two_finishes,
+            max_reach=max_reach,
+            crazy_mode=crazy_mode
+        )
+        if climb != None:
+            # Successfully generated a route
+            self.current_climb = climb  # Store for saving functionality
+            self.draw_climb(climb)  # Visualize the route on the board
+            # Calculate and display route-based difficulty (not based on sliders)
+            self.update_difficulty(climb)
+            # Enable save button when a route is generated
+            self.save_button.config(state="normal")
+        else:
+            # Route generation failed (e.g., no valid route found with given parameters)
+            self.current_climb = None
+            self.update_difficulty()  # Reset to default message
+            self.save_button.config(state="disabled")  # Disable save (no route to save)
+
+def start_gui(generate_climb, analyze_climb, resource_path):
+    """
+    Initialize and start the GUI application.
+    
+    Creates the main Tkinter window, initializes the KilterBoardGUI,
+    and starts the event loop. This is the entry point for the application.
+    
+    Args:
+        generate_climb: Route generator (project.generate_kilterclimb)
+        analyze_climb: Route scoring (project.analyze_route)
+        resource_path: Bundled file lookup (project.resource_path)
+    """
+    root = tk.Tk()
+    # Keep the window unmapped while the widgets are built, so it is laid out once when
+    # shown instead of being re-laid out as each widget is packed
+    root.withdraw()
+    KilterBoardGUI(root, generate_climb, analyze_climb, resource_path)
+    root.deiconify()
+    root.mainloop()
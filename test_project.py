@@ -0,0 +1,134 @@
+"""
+Tests for the route generator in project.py.
+
+Loads the shipped board layout and checks the route-setting rules that
+generate_kilterclimb() promises across a spread of reach, move-count, crazy-mode
+and finish settings. Routes are generated from seeded random.Random instances,
+so any failure can be replayed from the seed in its message.
+
+Run with: python -m pytest test_project.py (or python -m unittest test_project)
+"""
+
+import random
+import unittest
+
+import project
+
+# Routes generated per parameter combination
+ROUTES_PER_SETTING = 40
+
+# (max_reach, min_reach) pairs: the GUI defaults, a tight setting and wide/short extremes
+REACH_SETTINGS = ((12, 2), (4, 2), (20, 2), (8, 6))
+
+# (min_moves, max_moves) pairs
+MOVE_SETTINGS = ((2, 12), (2, 2), (20, 20))
+
+
+def in_reach(a, b, max_reach, min_reach) -> bool:
+    """
+    Check the reach rule between two holds independently of project.reachable_indices().
+
+    Args:
+        a: First Hold
+        b: Second Hold
+        max_reach: Maximum Euclidean distance
+        min_reach: Minimum Euclidean distance
+
+    Returns:
+        bool: True if the distance between a and b lies within [min_reach, max_reach]
+    """
+    dist_sq = (a.col - b.col) ** 2 + (a.row - b.row) ** 2
+    return min_reach * min_reach <= dist_sq <= max_reach * max_reach
+
+
+class GenerateKilterClimbTest(unittest.TestCase):
+    """Route invariants of generate_kilterclimb() on the shipped layout."""
+
+    @classmethod
+    def setUpClass(cls):
+        project.load_kilterBoard(project.resource_path("kilterBoardLayout.txt"))
+        # Every hand-grippable position on the board, for the finish fallback check
+        cls.hand_holds = [project.Hold(project.BOARD_COL[i], project.BOARD_ROW[i], "hand")
+                          for i in project.HAND_IDX]
+
+    def routes(self):
+        """
+        Generate routes across every setting combination.
+
+        Yields:
+            Tuple of (settings dict, route) with the seed included in settings
+        """
+        seed = 0
+        for max_reach, min_reach in REACH_SETTINGS:
+            for min_moves, max_moves in MOVE_SETTINGS:
+                for crazy_mode in (False, True):
+                    for two_finishes in (False, True):
+                        for _ in range(ROUTES_PER_SETTING):
+                            seed += 1
+                            settings = dict(max_reach=max_reach, min_reach=min_reach,
+                                            min_moves=min_moves, max_moves=max_moves,
+                                            crazy_mode=crazy_mode,
+                                            allow_two_finishes=two_finishes)
+                            route = project.generate_kilterclimb(rng=random.Random(seed), **settings)
+                            yield dict(settings, seed=seed), route
+
+    def test_route_invariants(self):
+        for settings, route in self.routes():
+            with self.subTest(**settings):
+                max_reach = settings["max_reach"]
+                min_reach = settings["min_reach"]
+                starts = [h for h in route if h.type == "start"]
+                moves = [h for h in route if h.type == "hand"]
+                finishes = [h for h in route if h.type == "finish"]
+
+                # Start holds: one or two, in the start zone (rows 7-13), a pair in reach
+                self.assertIn(len(starts), (1, 2))
+                for hold in starts:
+                    self.assertTrue(7 <= hold.row <= 13, f"start row {hold.row}")
+                if len(starts) == 2:
+                    self.assertTrue(in_reach(starts[0], starts[1], max_reach, min_reach))
+
+                # Hand moves: never more than max_moves, each in reach of the previous hand,
+                # and never downward unless crazy mode is on
+                self.assertLessEqual(len(moves), settings["max_moves"])
+                previous = starts[0]
+                if len(starts) == 2 and starts[1].row > starts[0].row:
+                    previous = starts[1]  # Moves continue from the higher start hand
+                for hold in moves:
+                    self.assertTrue(in_reach(previous, hold, max_reach, min_reach),
+                                    f"move ({previous.col},{previous.row})->({hold.col},{hold.row})")
+                    if not settings["crazy_mode"]:
+                        self.assertGreaterEqual(hold.row, previous.row)
+                    previous = hold
+
+                # Finishes: one or two (two only when allowed), the first in reach of the
+                # last hand whenever any hand hold is, the second in reach of the first
+                self.assertIn(len(finishes), (1, 2) if settings["allow_two_finishes"] else (1,))
+                if any(in_reach(previous, h, max_reach, min_reach) for h in self.hand_holds):
+                    self.assertTrue(in_reach(previous, finishes[0], max_reach, min_reach))
+                if len(finishes) == 2:
+                    self.assertTrue(in_reach(finishes[0], finishes[1], max_reach, min_reach))
+                    self.assertGreaterEqual(finishes[1].row, previous.row)
+
+    def test_same_seed_same_route(self):
+        first = project.generate_kilterclimb(rng=random.Random(42))
+        second = project.generate_kilterclimb(rng=random.Random(42))
+        self.assertEqual([(h.col, h.row, h.type) for h in first],
+                         [(h.col, h.row, h.type) for h in second])
+
+    def test_invalid_params_return_none(self):
+        self.assertIsNone(project.generate_kilterclimb(min_reach=10, max_reach=5))
+        self.assertIsNone(project.generate_kilterclimb(min_moves=10, max_moves=5))
+
+    def test_load_clears_caches(self):
+        project.generate_kilterclimb(rng=random.Random(1))
+        self.assertGreater(project.start_hand_pairs.cache_info().currsize, 0)
+        self.assertGreater(project.hand_moves.cache_info().currsize, 0)
+
+        project.load_kilterBoard(project.resource_path("kilterBoardLayout.txt"))
+        self.assertEqual(project.start_hand_pairs.cache_info().currsize, 0)
+        self.assertEqual(project.hand_moves.cache_info().currsize, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()